@@ -88,13 +88,16 @@ def _start_lcxl_listener(host: str, port: int):
                 with _lcxl_lock:
                     _lcxl_state["last_update"] = time.time()
                     
-                    # Handle MIDI CC events (knobs and faders)
-                    if data.get("ctrl") == "MIDI_CC":
-                        cc = data.get("cc", 0)
-                        normalized = data.get("normalized", 0.0)
-                        
-                        if cc in _cc_map:
-                            _lcxl_state[_cc_map[cc]] = normalized
+                    # Handle MIDI CC events (knobs and faders); the server
+                    # relays them in batches ("MIDI_CC_BATCH") during sweeps
+                    if data.get("ctrl") in ("MIDI_CC", "MIDI_CC_BATCH"):
+                        events = data.get("events", ()) if data["ctrl"] == "MIDI_CC_BATCH" else (data,)
+                        for event in events:
+                            cc = event.get("cc", 0)
+                            normalized = event.get("normalized", 0.0)
+                            
+                            if cc in _cc_map:
+                                _lcxl_state[_cc_map[cc]] = normalized
                     
                     # Handle MIDI Note events (buttons)
                     elif data.get("ctrl") == "MIDI_NOTE":
@@ -14,6 +14,9 @@ Usage (fully automatic, no prompts):
     python host.py
     python host.py --host=10.0.0.5    # Connect to remote web server
     python host.py --no-midi          # Disable MIDI
+    python host.py --udp              # Send events as UDP datagrams (no websocket)
+    python host.py --debug            # Also log unrecognized HID reports (hex dump)
+    python host.py --quiet            # Don't log every dial/button/MIDI event
 
 Manual mode (interactive device selection):
     python host.py --manual
@@ -36,9 +39,28 @@ import sys
 import asyncio
 import threading
 import json
+import atexit
+import logging
+import logging.handlers
+import queue
 import webbrowser
 import platform
+import socket
 from aiohttp import ClientSession
+from midi_map import MIDI_CC_NAMES, MIDI_CC_NORMALIZED, MIDI_NOTE_MAP  # Shared with web_server.py
+
+try:
+    import orjson  # Optional: faster JSON encoder producing bytes directly
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop  # Optional: faster event loop (not available on Windows)
+except ImportError:
+    try:
+        import winloop as uvloop  # Windows port of uvloop, same API
+    except ImportError:
+        uvloop = None
 
 # ==============================================================================
 # CONFIGURATION & STATE
@@ -50,41 +72,25 @@ WEB_PORT = 8080
 LOOP = None
 SEND_QUEUE = None
 
+# UDP bridge (--udp): datagrams are sent straight from the listener threads
+UDP_SOCK = None
+UDP_ADDR = None
+
+# Compact JSON (no spaces after ',' / ':') for every event sent to the receiver
+JSON_SEPARATORS = (',', ':')
+
+
+def encode_event(payload_obj):
+    """Serialize one event to compact UTF-8 JSON bytes (orjson if available)."""
+    if orjson is not None:
+        return orjson.dumps(payload_obj)
+    return json.dumps(payload_obj, separators=JSON_SEPARATORS).encode('utf-8')
+
 # MIDI Configuration
 MIDI_ENABLED = True
 MIDI_PORT_NAME = "Launch Control XL"  # Partial match for port name
 MIDI_POLL_INTERVAL = 0.001
 
-# Novation Launch Control XL CC mappings (CC number -> descriptive name)
-# Row 1: Send A knobs (CC 13-20)
-# Row 2: Send B knobs (CC 29-36)
-# Row 3: Pan knobs (CC 49-56)
-# Faders (CC 77-84)
-MIDI_CC_MAP = {
-    # Send A knobs (top row)
-    13: "KNOB_1A", 14: "KNOB_2A", 15: "KNOB_3A", 16: "KNOB_4A",
-    17: "KNOB_5A", 18: "KNOB_6A", 19: "KNOB_7A", 20: "KNOB_8A",
-    # Send B knobs (second row)
-    29: "KNOB_1B", 30: "KNOB_2B", 31: "KNOB_3B", 32: "KNOB_4B",
-    33: "KNOB_5B", 34: "KNOB_6B", 35: "KNOB_7B", 36: "KNOB_8B",
-    # Pan knobs (third row)
-    49: "KNOB_1C", 50: "KNOB_2C", 51: "KNOB_3C", 52: "KNOB_4C",
-    53: "KNOB_5C", 54: "KNOB_6C", 55: "KNOB_7C", 56: "KNOB_8C",
-    # Faders
-    77: "FADER_1", 78: "FADER_2", 79: "FADER_3", 80: "FADER_4",
-    81: "FADER_5", 82: "FADER_6", 83: "FADER_7", 84: "FADER_8",
-}
-
-# Note mappings for buttons (Note number -> descriptive name)
-MIDI_NOTE_MAP = {
-    # Track Focus buttons (top row)
-    41: "BTN_FOCUS_1", 42: "BTN_FOCUS_2", 43: "BTN_FOCUS_3", 44: "BTN_FOCUS_4",
-    57: "BTN_FOCUS_5", 58: "BTN_FOCUS_6", 59: "BTN_FOCUS_7", 60: "BTN_FOCUS_8",
-    # Track Control buttons (bottom row)
-    73: "BTN_CTRL_1", 74: "BTN_CTRL_2", 75: "BTN_CTRL_3", 76: "BTN_CTRL_4",
-    89: "BTN_CTRL_5", 90: "BTN_CTRL_6", 91: "BTN_CTRL_7", 92: "BTN_CTRL_8",
-}
-
 # Dialpad button mapping (byte index 1, bitmask values)
 DIALPAD_BUTTON_MAP = {
     0x08: 'TOP LEFT',
@@ -106,6 +112,9 @@ KEYPAD_BUTTONS = {
     9: "9",
 }
 
+# Button byte -> display name for every possible byte value (tuple index, no hashing)
+_KEYPAD_NAMES = tuple(KEYPAD_BUTTONS.get(i, f"UNKNOWN ({i})") for i in range(256))
+
 # State tracking
 LAST_DIALPAD_BTN_BYTE = 0
 LAST_KEYPAD_BUTTON = 0
@@ -114,10 +123,74 @@ LAST_KEYPAD_BUTTON = 0
 DEVICE_TYPE_DIALPAD = "dialpad"
 DEVICE_TYPE_KEYPAD = "keypad"
 
+# HID read size: large enough for hidapi to hand back several stacked
+# reports in one call when the driver has buffered them
+HID_READ_SIZE = 1024
+
+# Fixed report lengths (report ID -> bytes) used to split stacked reports.
+# Reports not listed here (e.g. keypad 0x13) are passed through whole.
+HID_REPORT_LENGTHS = {
+    0x02: 8,   # Dialpad vendor report (legacy)
+    0x11: 20,  # HID++ long report
+}
+
 # ==============================================================================
 # HELPER FUNCTIONS
 # ==============================================================================
 
+# Device events (dial turns, button presses) are logged here at INFO level
+_event_log = logging.getLogger("host.events")
+
+# Unrecognized HID reports are logged here at DEBUG level (enabled by --debug)
+_discovery_log = logging.getLogger("host.discovery")
+
+
+def setup_logging(debug=False):
+    """Route log records through a queue to a console handler on its own thread.
+
+    The HID and MIDI listener threads only enqueue records; the console write
+    (slow on a Windows terminal, even a minimized one) happens on the
+    listener thread instead of between two device reads.
+    """
+    records = queue.SimpleQueue()
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(records, console)
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(records))
+    root.setLevel(logging.DEBUG if debug else logging.INFO)
+    listener.start()
+    atexit.register(listener.stop)  # Flushes whatever is still queued
+    return listener
+
+
+class _HexDump:
+    """Formats report bytes as hex only if a log handler actually emits them."""
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        self.data = data
+
+    def __str__(self):
+        return " ".join(f"{b:02x}" for b in self.data)
+
+
+# (second, "HH:MM:SS") of the last formatted log timestamp
+_ts_cache = (0, "")
+
+
+def _ts():
+    """Return the current "HH:MM:SS" log timestamp, formatted once per second.
+
+    The cache is swapped as a single tuple so it is safe across listener threads.
+    """
+    global _ts_cache
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+    return _ts_cache[1]
+
+
 def get_signed_int(byte_val):
     """Converts a byte (0-255) to a signed int (-128 to 127)"""
     if byte_val > 127:
@@ -125,19 +198,77 @@ def get_signed_int(byte_val):
     return byte_val
 
 
+def iter_reports(data):
+    """Split a HID read buffer into individual reports.
+
+    The buffer is split only if it is exactly a run of known fixed-length
+    reports, back to back. Anything else (an unknown ID, a report longer or
+    shorter than expected, trailing bytes) is yielded unchanged as one report,
+    so a data byte that happens to equal a report ID never becomes a phantom
+    report.
+    """
+    total = len(data)
+    offset = 0
+    bounds = []
+    while offset < total:
+        size = HID_REPORT_LENGTHS.get(data[offset])
+        if size is None or offset + size > total:
+            yield data
+            return
+        bounds.append(offset)
+        offset += size
+    if len(bounds) == 1:
+        yield data
+        return
+    for start in bounds:
+        yield data[start:start + HID_REPORT_LENGTHS[data[start]]]
+
+
 def broadcast_to_web(ctrl_type, payload):
-    """Put a JSON payload onto the async SEND_QUEUE so the bridge task
-    can forward it to the receiver. Safe to call from HID thread.
+    """Forward a JSON payload to the receiver. Safe to call from HID thread.
+
+    In UDP mode the datagram is sent directly; otherwise the payload is put
+    onto the async SEND_QUEUE so the bridge task can forward it.
     """
-    if LOOP and SEND_QUEUE:
-        if isinstance(payload, dict):
-            payload_obj = {"ctrl": ctrl_type}
-            payload_obj.update(payload)
-        else:
-            payload_obj = {"ctrl": ctrl_type, "delta": payload}
+    if isinstance(payload, dict):
+        payload_obj = {"ctrl": ctrl_type}
+        payload_obj.update(payload)
+    else:
+        payload_obj = {"ctrl": ctrl_type, "delta": payload}
 
-        json_str = json.dumps(payload_obj)
-        asyncio.run_coroutine_threadsafe(SEND_QUEUE.put(json_str), LOOP)
+    send_event_bytes(encode_event(payload_obj))
+
+
+# UDP send failures are logged at most once per interval; the rest are counted
+UDP_WARN_INTERVAL = 1.0
+_udp_warn_at = 0.0
+_udp_suppressed = 0
+
+
+def _warn_udp_failure(err):
+    """Log a failed datagram without flooding the console from the input threads."""
+    global _udp_warn_at, _udp_suppressed
+    now = time.monotonic()
+    if now - _udp_warn_at < UDP_WARN_INTERVAL:
+        _udp_suppressed += 1
+        return
+    _udp_warn_at = now
+    suppressed, _udp_suppressed = _udp_suppressed, 0
+    if suppressed:
+        _event_log.warning("[-] UDP send failed: %s (%d more suppressed)", err, suppressed)
+    else:
+        _event_log.warning("[-] UDP send failed: %s", err)
+
+
+def send_event_bytes(buf):
+    """Forward one already-encoded event to the receiver (see broadcast_to_web)."""
+    if UDP_SOCK:
+        try:
+            UDP_SOCK.sendto(buf, UDP_ADDR)
+        except OSError as e:
+            _warn_udp_failure(e)
+    elif LOOP and SEND_QUEUE:
+        asyncio.run_coroutine_threadsafe(SEND_QUEUE.put(buf), LOOP)
 
 
 # ==============================================================================
@@ -157,19 +288,26 @@ def process_dialpad_data(data):
     - Byte 1: Button bitmask
     - Byte 6: Small scroller
     - Byte 7: Big dial
+
+    data is any bytes-like report (bytes or memoryview), indexed directly.
     """
     global LAST_DIALPAD_BTN_BYTE
     
     if not data:
         return
 
-    try:
-        seq = list(data)
-    except Exception:
-        seq = [int(x) for x in data]
+    report_id = data[0]
+
+    # Idle frames (no rotation, no button change) are the common case when the
+    # user is not touching the device: drop them before any formatting work
+    if report_id == 0x11:
+        if len(data) >= 6 and data[5] == 0:
+            return
+    elif report_id == 0x02:
+        if len(data) >= 8 and not (data[1] | data[6] | data[7] | LAST_DIALPAD_BTN_BYTE):
+            return
 
-    timestamp = time.strftime("%H:%M:%S", time.localtime())
-    report_id = seq[0] if seq else 0
+    timestamp = _ts()
 
     # =========================================================================
     # REPORT ID 0x11: Generic HID Mode (works with Logi Options+ killed)
@@ -178,25 +316,25 @@ def process_dialpad_data(data):
     # - type 0x0a = button/other
     # =========================================================================
     if report_id == 0x11:
-        if len(seq) < 6:
+        if len(data) < 6:
             return
         
-        msg_type = seq[2]  # 0x0d = dial, 0x0a = button/other
-        control_id = seq[4]
-        val = get_signed_int(seq[5])
+        msg_type = data[2]  # 0x0d = dial, 0x0a = button/other
+        control_id = data[4]
+        val = get_signed_int(data[5])
 
         # Dial rotation (control_id 0x00 or 0x01, msg_type 0x0d)
         if msg_type == 0x0d and val != 0:
             direction = "RIGHT (CW)" if val > 0 else "LEFT (CCW)"
             bar = "▓" * min(abs(val), 10)
-            print(f"[{timestamp}] BIG DIAL       | {direction:<10} | Speed: {val:<3} | {bar}")
+            _event_log.info("[%s] BIG DIAL       | %-10s | Speed: %-3s | %s", timestamp, direction, val, bar)
             broadcast_to_web("BIG", val)
         
         # Button events (msg_type 0x0a)
         elif msg_type == 0x0a:
             # Byte 5 seems to contain button identifier: 0x53, 0x56, 0x59, 0x5a
             # These may map to the 4 corner buttons
-            btn_val = seq[5]
+            btn_val = data[5]
             if btn_val != 0:
                 # Map button values to names (discovered values)
                 btn_map = {
@@ -207,21 +345,21 @@ def process_dialpad_data(data):
                 }
                 btn_name = btn_map.get(btn_val, f"BTN_0x{btn_val:02x}")
                 # Check byte 6 or 7 for press/release state
-                state_byte = seq[6] if len(seq) > 6 else 0
+                state_byte = data[6] if len(data) > 6 else 0
                 action = "PRESSED" if state_byte else "RELEASED"
-                print(f"[{timestamp}] DIALPAD BTN   | {btn_name:<12} | {action}")
+                _event_log.info("[%s] DIALPAD BTN   | %-12s | %s", timestamp, btn_name, action)
                 broadcast_to_web("BTN", {"name": btn_name, "state": action})
 
     # =========================================================================
     # REPORT ID 0x02: Vendor Mode (legacy - may not work with Logi Options+)
     # =========================================================================
     elif report_id == 0x02:
-        if len(seq) < 8:
+        if len(data) < 8:
             return
 
         # Dial values
-        raw_small = seq[6]  # Small scroller
-        raw_big = seq[7]    # Big dial
+        raw_small = data[6]  # Small scroller
+        raw_big = data[7]    # Big dial
 
         val_small = get_signed_int(raw_small)
         val_big = get_signed_int(raw_big)
@@ -230,67 +368,76 @@ def process_dialpad_data(data):
         if val_small != 0:
             direction = "RIGHT (CW)" if val_small > 0 else "LEFT (CCW)"
             bar = "▒" * abs(val_small)
-            print(f"[{timestamp}] SMALL SCROLLER | {direction:<10} | Speed: {val_small:<3} | {bar}")
+            _event_log.info("[%s] SMALL SCROLLER | %-10s | Speed: %-3s | %s", timestamp, direction, val_small, bar)
             broadcast_to_web("SMALL", val_small)
 
         # Big dial
         if val_big != 0:
             direction = "RIGHT (CW)" if val_big > 0 else "LEFT (CCW)"
             bar = "▓" * abs(val_big)
-            print(f"[{timestamp}] BIG DIAL       | {direction:<10} | Speed: {val_big:<3} | {bar}")
+            _event_log.info("[%s] BIG DIAL       | %-10s | Speed: %-3s | %s", timestamp, direction, val_big, bar)
             broadcast_to_web("BIG", val_big)
 
         # Dialpad buttons (4 corner buttons)
-        btn_byte = seq[1] if len(seq) > 1 else 0
+        btn_byte = data[1] if len(data) > 1 else 0
         changed = btn_byte ^ LAST_DIALPAD_BTN_BYTE
         if changed:
             for bit, name in DIALPAD_BUTTON_MAP.items():
                 if changed & bit:
                     state = bool(btn_byte & bit)
                     action = 'PRESSED' if state else 'RELEASED'
-                    print(f"[{timestamp}] DIALPAD BTN   | {name:<12} | {action}")
+                    _event_log.info("[%s] DIALPAD BTN   | %-12s | %s", timestamp, name, action)
                     broadcast_to_web("BTN", {"name": name, "state": action})
         LAST_DIALPAD_BTN_BYTE = btn_byte
 
+    elif _discovery_log.isEnabledFor(logging.DEBUG):
+        _discovery_log.debug("[%s] DIALPAD RID=0x%02x | HEX: %s", timestamp, report_id, _HexDump(data))
+
 
 # ==============================================================================
 # KEYPAD DATA PROCESSING
 # ==============================================================================
 
 def process_keypad_data(data):
-    """Process data from MX Creative Keypad (9 buttons)"""
+    """Process data from MX Creative Keypad (9 buttons)
+
+    data is any bytes-like report (bytes or memoryview), indexed directly.
+    """
     global LAST_KEYPAD_BUTTON
     
     if not data:
         return
 
-    try:
-        seq = list(data)
-    except Exception:
-        seq = [int(x) for x in data]
+    report_id = data[0]
+
+    # Idle frame: no button down now and none held before
+    if report_id == 0x13 and len(data) > 6 and not (data[6] | LAST_KEYPAD_BUTTON):
+        return
 
-    timestamp = time.strftime("%H:%M:%S", time.localtime())
-    report_id = seq[0] if seq else 0
+    timestamp = _ts()
 
     # =========================================================================
     # REPORT ID 0x13: MX Creative Keypad buttons
     # =========================================================================
-    if report_id == 0x13 and len(seq) > 6:
-        button_byte = seq[6]
+    if report_id == 0x13 and len(data) > 6:
+        button_byte = data[6]
         
         if button_byte != 0:
             # Button pressed
-            btn_name = KEYPAD_BUTTONS.get(button_byte, f"UNKNOWN ({button_byte})")
-            print(f"[{timestamp}] KEYPAD BTN    | {btn_name:<12} | PRESSED")
+            btn_name = _KEYPAD_NAMES[button_byte]
+            _event_log.info("[%s] KEYPAD BTN    | %-12s | PRESSED", timestamp, btn_name)
             LAST_KEYPAD_BUTTON = button_byte
             broadcast_to_web("KEYPAD", {"button": button_byte, "state": "PRESSED"})
         elif LAST_KEYPAD_BUTTON != 0:
             # Button released
-            btn_name = KEYPAD_BUTTONS.get(LAST_KEYPAD_BUTTON, f"UNKNOWN ({LAST_KEYPAD_BUTTON})")
-            print(f"[{timestamp}] KEYPAD BTN    | {btn_name:<12} | RELEASED")
+            btn_name = _KEYPAD_NAMES[LAST_KEYPAD_BUTTON]
+            _event_log.info("[%s] KEYPAD BTN    | %-12s | RELEASED", timestamp, btn_name)
             broadcast_to_web("KEYPAD", {"button": LAST_KEYPAD_BUTTON, "state": "RELEASED"})
             LAST_KEYPAD_BUTTON = 0
 
+    elif report_id != 0x13 and _discovery_log.isEnabledFor(logging.DEBUG):
+        _discovery_log.debug("[%s] KEYPAD RID=0x%02x | HEX: %s", timestamp, report_id, _HexDump(data))
+
 
 # ==============================================================================
 # DEVICE SCANNING
@@ -450,15 +597,18 @@ def hid_listener_thread(device_path, device_type, device_name):
 
             while True:
                 try:
-                    data = h.read(64, timeout_ms=1000)
+                    data = h.read(HID_READ_SIZE, timeout_ms=1000)
                 except TypeError:
                     try:
-                        data = h.read(64, 1000)
+                        data = h.read(HID_READ_SIZE, 1000)
                     except Exception:
-                        data = h.read(64)
+                        data = h.read(HID_READ_SIZE)
 
                 if data:
-                    process_fn(data)
+                    if isinstance(data, list):
+                        data = bytes(data)
+                    for report in iter_reports(memoryview(data)):
+                        process_fn(report)
                 time.sleep(0.001)
         else:
             # ctypes-style API
@@ -470,15 +620,18 @@ def hid_listener_thread(device_path, device_type, device_name):
 
             while True:
                 try:
-                    data = h.read(64, timeout=1000)
+                    data = h.read(HID_READ_SIZE, timeout=1000)
                 except TypeError:
                     try:
-                        data = h.read(64, 1000)
+                        data = h.read(HID_READ_SIZE, 1000)
                     except Exception:
-                        data = h.read(64)
+                        data = h.read(HID_READ_SIZE)
 
                 if data:
-                    process_fn(data)
+                    if isinstance(data, list):
+                        data = bytes(data)
+                    for report in iter_reports(memoryview(data)):
+                        process_fn(report)
                 time.sleep(0.001)
 
     except IOError as e:
@@ -547,7 +700,7 @@ def midi_listener_thread():
                 data1 = midi_data[1] if len(midi_data) > 1 else 0
                 data2 = midi_data[2] if len(midi_data) > 2 else 0
                 
-                timestamp = time.strftime("%H:%M:%S", time.localtime())
+                timestamp = _ts()
                 channel = status & 0x0F
                 msg_type = status & 0xF0
                 
@@ -555,25 +708,12 @@ def midi_listener_thread():
                 if msg_type == 0xB0:
                     cc_num = data1
                     cc_val = data2
-                    normalized = round((cc_val / 127.0) * 100.0, 1)
+                    normalized = MIDI_CC_NORMALIZED[cc_val]
                     
-                    if cc_num in MIDI_CC_MAP:
-                        cc_name = MIDI_CC_MAP[cc_num]
-                        print(f"[{timestamp}] MIDI CC       | {cc_name:<12} | Val: {cc_val:3d} ({normalized:5.1f}%)")
-                        broadcast_to_web("MIDI_CC", {
-                            "cc": cc_num,
-                            "name": cc_name,
-                            "value": cc_val,
-                            "normalized": normalized
-                        })
-                    else:
-                        print(f"[{timestamp}] MIDI CC       | CC_{cc_num:<9} | Val: {cc_val:3d} ({normalized:5.1f}%)")
-                        broadcast_to_web("MIDI_CC", {
-                            "cc": cc_num,
-                            "name": f"CC_{cc_num}",
-                            "value": cc_val,
-                            "normalized": normalized
-                        })
+                    _event_log.info("[%s] MIDI CC       | %-12s | Val: %3d (%5.1f%%)", timestamp, MIDI_CC_NAMES[cc_num], cc_val, normalized)
+                    # The raw 3-byte message is the event: web_server.py names
+                    # it and builds the MIDI_CC JSON (see midi_map.py)
+                    send_event_bytes(bytes((status, cc_num, cc_val)))
                 
                 # Note On: 0x90-0x9F (144-159)
                 elif msg_type == 0x90:
@@ -586,7 +726,7 @@ def midi_listener_thread():
                             # Toggle button state
                             button_states[note] = not button_states.get(note, False)
                             state = "ON" if button_states[note] else "OFF"
-                            print(f"[{timestamp}] MIDI NOTE     | {note_name:<12} | {state} (vel: {velocity})")
+                            _event_log.info("[%s] MIDI NOTE     | %-12s | %s (vel: %d)", timestamp, note_name, state, velocity)
                             broadcast_to_web("MIDI_NOTE", {
                                 "note": note,
                                 "name": note_name,
@@ -594,7 +734,7 @@ def midi_listener_thread():
                                 "state": state
                             })
                         else:
-                            print(f"[{timestamp}] MIDI NOTE     | Note_{note:<7} | ON (vel: {velocity})")
+                            _event_log.info("[%s] MIDI NOTE     | Note_%-7d | ON (vel: %d)", timestamp, note, velocity)
                             broadcast_to_web("MIDI_NOTE", {
                                 "note": note,
                                 "name": f"Note_{note}",
@@ -604,14 +744,14 @@ def midi_listener_thread():
                     else:  # Note Off (velocity 0)
                         if note in MIDI_NOTE_MAP:
                             note_name = MIDI_NOTE_MAP[note]
-                            print(f"[{timestamp}] MIDI NOTE     | {note_name:<12} | RELEASE")
+                            _event_log.info("[%s] MIDI NOTE     | %-12s | RELEASE", timestamp, note_name)
                         
                 # Note Off: 0x80-0x8F (128-143)
                 elif msg_type == 0x80:
                     note = data1
                     if note in MIDI_NOTE_MAP:
                         note_name = MIDI_NOTE_MAP[note]
-                        print(f"[{timestamp}] MIDI NOTE     | {note_name:<12} | RELEASE")
+                        _event_log.info("[%s] MIDI NOTE     | %-12s | RELEASE", timestamp, note_name)
             
             time.sleep(MIDI_POLL_INTERVAL)
             
@@ -629,7 +769,8 @@ async def _send_loop_over_ws(ws):
     while True:
         payload = await SEND_QUEUE.get()
         try:
-            await ws.send_str(payload)
+            # Binary frame: the JSON bytes go out as-is, no str round trip
+            await ws.send_bytes(payload)
         except Exception:
             raise
 
@@ -658,11 +799,21 @@ async def _bridge_client_loop(receiver_host, receiver_port):
 # ==============================================================================
 
 def main():
-    global LOOP, MIDI_ENABLED
+    global LOOP, MIDI_ENABLED, UDP_SOCK, UDP_ADDR
     
     # Check for manual mode flag
     manual_mode = '--manual' in sys.argv or '-m' in sys.argv
     
+    # Check for --udp flag (datagram bridge instead of websocket)
+    udp_mode = '--udp' in sys.argv
+    
+    # Check for --debug flag (log unrecognized HID reports)
+    setup_logging('--debug' in sys.argv)
+    
+    # Check for --quiet flag (no per-event lines: a fader sweep logs dozens a second)
+    if '--quiet' in sys.argv:
+        _event_log.setLevel(logging.WARNING)
+    
     # Check for --no-midi flag
     if '--no-midi' in sys.argv:
         MIDI_ENABLED = False
@@ -741,11 +892,20 @@ def main():
         print(f"  [{dev_type.upper()}] {name}")
     if MIDI_ENABLED:
         print(f"  [MIDI] {MIDI_PORT_NAME}")
-    print(f"  Receiver: ws://{receiver}:{WEB_PORT}/bridge")
+    if udp_mode:
+        print(f"  Receiver: udp://{receiver}:{WEB_PORT}")
+    else:
+        print(f"  Receiver: ws://{receiver}:{WEB_PORT}/bridge")
     print("=" * 60)
     print("Press Ctrl+C to stop.\n")
 
-    # 4. START HID THREADS FOR EACH DEVICE
+    # 4. OPEN UDP SOCKET (before listener threads start sending)
+    if udp_mode:
+        UDP_SOCK = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        UDP_SOCK.setblocking(False)
+        UDP_ADDR = (receiver, WEB_PORT)
+
+    # 5. START HID THREADS FOR EACH DEVICE
     for path, dev_type, name in selected_devices:
         t = threading.Thread(
             target=hid_listener_thread,
@@ -754,26 +914,41 @@ def main():
         )
         t.start()
 
-    # 5. START MIDI THREAD (if enabled)
+    # 6. START MIDI THREAD (if enabled)
     if MIDI_ENABLED:
         midi_thread = threading.Thread(target=midi_listener_thread, daemon=True)
         midi_thread.start()
 
-    # 6. Optionally open the web UI (only in manual mode)
+    # 7. Optionally open the web UI (only in manual mode)
     if manual_mode:
         try:
             webbrowser.open(f"http://{receiver}:{WEB_PORT}")
         except Exception:
             pass
 
-    # 6. START BRIDGE CLIENT (Main Thread)
+    # 8. UDP MODE: listener threads send directly, main thread just waits
+    if udp_mode:
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            print("\n[*] Stopping.")
+        finally:
+            UDP_SOCK.close()
+        return
+
+    # 8. START BRIDGE CLIENT (Main Thread)
     async def run_bridge_client():
         global LOOP
         LOOP = asyncio.get_running_loop()
         await _bridge_client_loop(receiver, WEB_PORT)
 
+    # uvloop.run() instead of the deprecated uvloop.install(); without
+    # uvloop/winloop asyncio's default is used (IOCP proactor on Windows)
+    run = uvloop.run if uvloop is not None else asyncio.run
+
     try:
-        asyncio.run(run_bridge_client())
+        run(run_bridge_client())
     except KeyboardInterrupt:
         print("\n[*] Stopping.")
 
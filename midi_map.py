@@ -0,0 +1,68 @@
+"""
+midi_map.py - Launch Control XL mappings shared by host.py and web_server.py
+
+host.py forwards MIDI CC messages to the web server as raw 3-byte MIDI
+frames (status, cc, value) instead of JSON. web_server.py recognizes them
+by the status byte (>= 0x80; a JSON event always starts with '{') and uses
+the tables below to name the control and to rebuild the MIDI_CC JSON event
+the browsers and ComfyUI receivers expect, so both ends must agree on them.
+"""
+import json
+
+# Novation Launch Control XL CC mappings (CC number -> descriptive name)
+# Row 1: Send A knobs (CC 13-20)
+# Row 2: Send B knobs (CC 29-36)
+# Row 3: Pan knobs (CC 49-56)
+# Faders (CC 77-84)
+MIDI_CC_MAP = {
+    # Send A knobs (top row)
+    13: "KNOB_1A", 14: "KNOB_2A", 15: "KNOB_3A", 16: "KNOB_4A",
+    17: "KNOB_5A", 18: "KNOB_6A", 19: "KNOB_7A", 20: "KNOB_8A",
+    # Send B knobs (second row)
+    29: "KNOB_1B", 30: "KNOB_2B", 31: "KNOB_3B", 32: "KNOB_4B",
+    33: "KNOB_5B", 34: "KNOB_6B", 35: "KNOB_7B", 36: "KNOB_8B",
+    # Pan knobs (third row)
+    49: "KNOB_1C", 50: "KNOB_2C", 51: "KNOB_3C", 52: "KNOB_4C",
+    53: "KNOB_5C", 54: "KNOB_6C", 55: "KNOB_7C", 56: "KNOB_8C",
+    # Faders
+    77: "FADER_1", 78: "FADER_2", 79: "FADER_3", 80: "FADER_4",
+    81: "FADER_5", 82: "FADER_6", 83: "FADER_7", 84: "FADER_8",
+}
+
+# Note mappings for buttons (Note number -> descriptive name)
+MIDI_NOTE_MAP = {
+    # Track Focus buttons (top row)
+    41: "BTN_FOCUS_1", 42: "BTN_FOCUS_2", 43: "BTN_FOCUS_3", 44: "BTN_FOCUS_4",
+    57: "BTN_FOCUS_5", 58: "BTN_FOCUS_6", 59: "BTN_FOCUS_7", 60: "BTN_FOCUS_8",
+    # Track Control buttons (bottom row)
+    73: "BTN_CTRL_1", 74: "BTN_CTRL_2", 75: "BTN_CTRL_3", 76: "BTN_CTRL_4",
+    89: "BTN_CTRL_5", 90: "BTN_CTRL_6", 91: "BTN_CTRL_7", 92: "BTN_CTRL_8",
+}
+
+# Event name of every CC number (unmapped ones are "CC_<n>")
+MIDI_CC_NAMES = tuple(MIDI_CC_MAP.get(cc, f"CC_{cc}") for cc in range(128))
+
+# CC value (0-127) -> the "normalized" percentage sent with MIDI_CC events
+MIDI_CC_NORMALIZED = tuple(round((val / 127.0) * 100.0, 1) for val in range(128))
+
+
+def _encode(obj):
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+# A MIDI_CC event is assembled from pre-encoded pieces instead of a dict +
+# JSON encode: a per-CC prefix ('{"ctrl":"MIDI_CC","cc":N,"name":"..."') and
+# a per-value suffix (',"value":V,"normalized":P}'). Only two numbers vary.
+MIDI_CC_PREFIX = tuple(
+    _encode({"ctrl": "MIDI_CC", "cc": cc, "name": MIDI_CC_NAMES[cc]})[:-1]
+    for cc in range(128)
+)
+MIDI_CC_SUFFIX = tuple(
+    _encode({"value": val, "normalized": MIDI_CC_NORMALIZED[val]}).replace(b'{', b',', 1)
+    for val in range(128)
+)
+
+
+def midi_cc_event(cc, value):
+    """MIDI_CC JSON event bytes for a 7-bit CC number and value."""
+    return MIDI_CC_PREFIX[cc] + MIDI_CC_SUFFIX[value]
@@ -17,7 +17,7 @@ echo Starting Logi services in DEBUG mode...
 echo.
 
 REM Start web_server.py in a new VISIBLE window
-start "Logi Web Server" cmd /k "cd /d %~dp0 & venv\Scripts\python.exe web_server.py"
+start "Logi Web Server" cmd /k "cd /d %~dp0 & venv\Scripts\python.exe web_server.py --host 127.0.0.1"
 
 REM Give the web server a moment to start
 echo Waiting for web server to start...
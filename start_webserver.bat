@@ -10,8 +10,8 @@ if not exist "venv\Scripts\python.exe" (
     exit /b 1
 )
 
-REM Start web_server.py minimized (auto-select localhost)
-start "" /min cmd /c "cd /d %~dp0 && echo 1 | venv\Scripts\python.exe web_server.py"
+REM Start web_server.py minimized (bound to localhost)
+start "" /min cmd /c "cd /d %~dp0 && venv\Scripts\python.exe web_server.py --host 127.0.0.1"
 
 popd
 exit /b 0
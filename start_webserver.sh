@@ -1,4 +1,4 @@
 #!/bin/bash
 # Start the web server on macOS
 cd "$(dirname "$0")"
-DYLD_LIBRARY_PATH=/opt/homebrew/lib ./venv/bin/python web_server.py
+DYLD_LIBRARY_PATH=/opt/homebrew/lib ./venv/bin/python web_server.py --host "${BIND_HOST:-127.0.0.1}"
@@ -16,8 +16,11 @@ if not exist "venv\Scripts\python.exe" (
 echo Starting Logi web server in DEBUG mode (remote host mode)...
 echo.
 
+REM Remote host mode: listen on the LAN (set BIND_HOST to pick one address)
+if not defined BIND_HOST set BIND_HOST=0.0.0.0
+
 REM Start web_server.py in a new VISIBLE window
-start "Logi Web Server" cmd /k "cd /d %~dp0 & venv\Scripts\python.exe web_server.py"
+start "Logi Web Server" cmd /k "cd /d %~dp0 & venv\Scripts\python.exe web_server.py --host %BIND_HOST%"
 
 echo.
 echo Logi web server started in DEBUG mode (terminal visible).
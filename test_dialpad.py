@@ -41,7 +41,7 @@ for i, d in enumerate(dialpad_interfaces):
         
         while time.time() - start < 5:  # 5 seconds per interface
             try:
-                data = h.read(64)  # Non-blocking read
+                data = h.read(1024)  # Non-blocking read
                 if data:
                     data_samples.append([hex(x) for x in data[:10]])
                     got_data = True
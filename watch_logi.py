@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Event-driven consumer for the files web_server.py writes.
+
+Instead of polling logi_command.json / logi_position.json / logi_button.json
+(and controller_state.json), wait for the OS to report a change
+(ReadDirectoryChangesW on Windows, inotify on Linux, FSEvents on macOS) and
+read the file only then.
+
+Usage:
+    python watch_logi.py
+
+Requires the optional `watchdog` package (pip install watchdog).
+Replace on_file_changed() with whatever should react to new data.
+"""
+import json
+import os
+import platform
+import time
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    raise SystemExit("[-] watch_logi.py needs watchdog: pip install watchdog")
+
+LOGI_DIR = "C:/temp"
+if platform.system() == "Windows":
+    STATE_DIR = LOGI_DIR
+else:
+    STATE_DIR = "/tmp"
+
+WATCHED_FILES = {
+    os.path.normcase(os.path.abspath(os.path.join(LOGI_DIR, name)))
+    for name in ("logi_command.json", "logi_position.json", "logi_button.json")
+}
+WATCHED_FILES.add(os.path.normcase(os.path.abspath(os.path.join(STATE_DIR, "controller_state.json"))))
+
+
+def on_file_changed(path, data):
+    """Called once per change with the freshly parsed file contents."""
+    print(f"[*] {os.path.basename(path)}: {data}")
+
+
+class LogiFileHandler(FileSystemEventHandler):
+    """Dispatches changes to the watched JSON files to on_file_changed."""
+
+    def _handle(self, path):
+        if os.path.normcase(os.path.abspath(path)) not in WATCHED_FILES:
+            return
+        try:
+            # web_server.py overwrites these files in place (padded with
+            # trailing spaces, which json.loads ignores), so every update is a
+            # modify event on the same path
+            with open(path, 'rb') as f:
+                data = json.loads(f.read())
+        except (OSError, ValueError):
+            return  # Caught mid-write; the write's own modify event covers it
+        on_file_changed(path, data)
+
+    def on_modified(self, event):
+        if not event.is_directory:
+            self._handle(event.src_path)
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self._handle(event.src_path)
+
+
+def main():
+    handler = LogiFileHandler()
+    observer = Observer()  # Picks the native backend for this platform
+    for directory in {LOGI_DIR, STATE_DIR}:
+        os.makedirs(directory, exist_ok=True)
+        observer.schedule(handler, directory, recursive=False)
+    observer.start()
+    print(f"[*] Watching {', '.join(sorted({LOGI_DIR, STATE_DIR}))} (Ctrl+C to stop)")
+    try:
+        while observer.is_alive():
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        observer.stop()
+        observer.join()
+
+
+if __name__ == '__main__':
+    main()
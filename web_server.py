@@ -1,12 +1,56 @@
+import argparse
 import asyncio
-import json
+import gc
+import gzip
+import hashlib
+import atexit
+import logging
+import logging.handlers
+import math
+import queue
+import sys
 import time
 import os
 import platform
+import re
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from aiohttp import web
+from multidict import CIMultiDict
+from midi_map import MIDI_CC_NAMES, midi_cc_event  # Shared with host.py
+
+try:
+    import orjson  # Optional: faster JSON codec that works in bytes
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop  # Optional: faster event loop (not available on Windows)
+except ImportError:
+    try:
+        import winloop as uvloop  # Windows port of uvloop, same API
+    except ImportError:
+        uvloop = None
+
+# json_dumps returns compact UTF-8 bytes and json_loads accepts bytes, with
+# or without orjson
+if orjson is not None:
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+else:
+    import json
+
+    def json_dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+    json_loads = json.loads
 
 WEB_PORT = 8080
+
+# Per-event messages are logged at DEBUG (run with --debug to see them), so
+# the hot path skips formatting and console I/O by default; see setup_logging
+log = logging.getLogger("bridge")
+
 COMMAND_FILE = "C:/temp/logi_command.json"
 POSITION_FILE = "C:/temp/logi_position.json"
 BUTTON_FILE = "C:/temp/logi_button.json"
@@ -55,94 +99,207 @@ controller_state = {
     # LCXL Control buttons (bottom row)
     "ctrl_1": False, "ctrl_2": False, "ctrl_3": False, "ctrl_4": False,
     "ctrl_5": False, "ctrl_6": False, "ctrl_7": False, "ctrl_8": False,
-    # Timestamp
-    "last_update": 0,
+    # "last_update" (timestamp) is appended by write_state_file_now
 }
 state_lock = threading.Lock()
 
-# Throttle file writes to reduce I/O
-last_file_write = 0
-FILE_WRITE_INTERVAL = 0.016  # ~60fps max file write rate
-state_dirty = False
+# All blocking file writes run on one worker thread: keeps them off the event
+# loop while preserving their order
+_FILE_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="file-writer")
+
+
+def submit_file_write(fn, *args):
+    """Queue a blocking file write on the file writer thread."""
+    _FILE_POOL.submit(fn, *args)
+
+
+def timestamp_us():
+    """Wall-clock time in integer microseconds, the timestamp written to files.
+
+    Integers encode faster than floats and, at this resolution, stay exact in
+    the JavaScript readers (well below 2**53). Readers only compare them.
+    """
+    return time.time_ns() // 1000
+
+
+_last_state_hash = None  # hash of the last state written, without last_update
 
 
 def write_state_file_now():
-    """Immediately write state file."""
-    global last_file_write
+    """Immediately write state file (skipped if nothing changed since the last write)."""
+    global _last_state_hash
     try:
+        # Hold the lock only for the copy; encoding and I/O use the snapshot
+        # (only the file writer thread gets here, so the hash needs no lock)
         with state_lock:
-            controller_state["last_update"] = time.time()
-            with open(STATE_FILE, 'w') as f:
-                json.dump(controller_state, f)
-        last_file_write = time.time()
+            snapshot = controller_state.copy()
+        content = json_dumps(snapshot)
+        content_hash = hash(content)
+        if content_hash == _last_state_hash:
+            return
+        # Splice the timestamp into the object so unchanged content hashes equal
+        buf = content[:-1] + b',"last_update":%d}' % timestamp_us()
+        # In place through a descriptor kept open: no reopen per write
+        # and no truncate, so a reader never catches an empty file
+        overwrite_file(STATE_FILE, buf)
+        _last_state_hash = content_hash
         # Update heartbeat file alongside state
         try:
-            data = {"ts": time.time()}
-            tmp = HEARTBEAT_FILE + ".tmp"
-            with open(tmp, 'w') as hf:
-                json.dump(data, hf)
-            os.replace(tmp, HEARTBEAT_FILE)
-        except Exception:
+            overwrite_file(HEARTBEAT_FILE, json_dumps({"ts": timestamp_us()}))
+        except OSError:
             pass
-    except Exception as e:
+    except OSError:
         pass
 
 
-def write_state_file_throttled():
-    """Write state file if dirty and enough time has passed."""
-    global last_file_write, state_dirty
-    
-    if not state_dirty:
-        return
-    
-    now = time.time()
-    if now - last_file_write < FILE_WRITE_INTERVAL:
-        return
-    
-    write_state_file_now()
-    state_dirty = False
+# True while a state file write is queued on the file writer thread but has
+# not started yet. Further updates ride along with that write (latest wins):
+# it snapshots controller_state when it runs, not when it was queued.
+_state_write_queued = False
 
 
-def write_state_file():
-    """Write the current controller state to file."""
-    global state_dirty
-    state_dirty = True
-    # Always write immediately for responsiveness
+def _run_queued_state_write():
+    global _state_write_queued
+    # Cleared before writing, so an update landing mid-write queues another
+    _state_write_queued = False
     write_state_file_now()
 
 
-def update_controller_state(key, value):
-    """Update a controller state value and write to file."""
-    global state_dirty
+def request_state_write():
+    """Queue a state file write unless one is already waiting to run."""
+    global _state_write_queued
+    if not _state_write_queued:
+        _state_write_queued = True
+        submit_file_write(_run_queued_state_write)
+
+
+# Continuous controls (faders, knobs) send dozens of updates per second; the
+# state file is written once per window instead of once per update
+STATE_WRITE_DEBOUNCE = 0.02
+_state_flush_handle = None  # asyncio.TimerHandle of the pending debounced write
+
+
+def _flush_debounced_state():
+    global _state_flush_handle
+    _state_flush_handle = None
+    request_state_write()
+
+
+def schedule_state_write():
+    """Debounced state write; call from the event loop."""
+    global _state_flush_handle
+    if _state_flush_handle is None:
+        _state_flush_handle = asyncio.get_running_loop().call_later(
+            STATE_WRITE_DEBOUNCE, _flush_debounced_state
+        )
+
+
+def force_flush_state():
+    """Write the state now (folding in any debounced updates); call from the event loop."""
+    global _state_flush_handle
+    if _state_flush_handle is not None:
+        _state_flush_handle.cancel()
+        _state_flush_handle = None
+    request_state_write()
+
+
+def update_controller_state(key, value, force=False):
+    """Update a controller state value and write to file.
+
+    Buttons pass force=True so a press reaches ComfyUI without the debounce
+    delay; continuous controls are coalesced by schedule_state_write.
+    """
     with state_lock:
-        if controller_state.get(key) != value:
+        changed = controller_state.get(key) != value
+        if changed:
             controller_state[key] = value
-            state_dirty = True
-    # Write immediately for MIDI responsiveness
-    if state_dirty:
-        write_state_file_now()
-        state_dirty = False
+    if changed:
+        # Written on the file writer thread
+        if force:
+            force_flush_state()
+        else:
+            schedule_state_write()
 
 
 # Global state for tracking slider and accumulated position
 last_slider_state = {
     "delta": 0,
-    "ctrl": "unknown"
+    "ctrl": "unknown",
+    "buttons": 0
 }
 
+# Serialized /status body, re-encoded only after last_slider_state changes
+_status_cache = b'{}'
+_status_dirty = True
+
 # Accumulated position offsets
 accumulated_position = {
     "x": 0,
     "y": 0
 }
 
-# Button states
-button_states = {
-    "TOP LEFT": False,
-    "TOP RIGHT": False,
-    "BOTTOM LEFT": False,
-    "BOTTOM RIGHT": False
+# Serialized /position body, re-encoded only after accumulated_position changes
+_position_cache = b'{}'
+_position_dirty = True
+
+# Button states, one bit per dialpad button (exposed as "buttons" in /status)
+BTN_BIT = {
+    "TOP LEFT": 1,
+    "TOP RIGHT": 2,
+    "BOTTOM LEFT": 4,
+    "BOTTOM RIGHT": 8
 }
+button_mask = 0
+
+
+# Files overwritten in place through a descriptor that stays open (path -> fd)
+_open_fds = {}
+_file_sizes = {}  # path -> current size in bytes
+
+
+def overwrite_file(path, buf):
+    """Replace the contents of path with buf without reopening the file.
+
+    Uses pwrite where available (POSIX), otherwise seek + write (Windows).
+    A buffer shorter than the file is padded with trailing spaces (valid
+    JSON whitespace) instead of truncating afterwards, so the whole update is
+    one write and a reader never sees new content followed by a stale tail.
+    Writes deliberately stay buffered (no O_DIRECT / FILE_FLAG_NO_BUFFERING):
+    the ExtendScript poller reads these files straight back out of the page
+    cache, whereas unbuffered I/O would turn every dial tick into a sector
+    aligned, padded disk write.
+    """
+    fd = _open_fds.get(path)
+    if fd is None:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+        _open_fds[path] = fd
+        _file_sizes[path] = 0
+    size = _file_sizes[path]
+    if len(buf) < size:
+        buf = buf.ljust(size, b' ')
+    else:
+        _file_sizes[path] = len(buf)
+    if hasattr(os, 'pwrite'):
+        os.pwrite(fd, buf, 0)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.write(fd, buf)
+
+
+def _close_open_fds():
+    _file_sizes.clear()
+    while _open_fds:
+        _, fd = _open_fds.popitem()
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+
+
+async def close_open_files(app):
+    """aiohttp on_cleanup hook: close descriptors kept open by overwrite_file."""
+    # Runs on the file writer thread so it cannot race a pending write
+    await asyncio.get_running_loop().run_in_executor(_FILE_POOL, _close_open_fds)
 
 
 def write_command_file(delta, ctrl="BIG"):
@@ -151,61 +308,105 @@ def write_command_file(delta, ctrl="BIG"):
         cmd = {
             "delta": delta,
             "ctrl": ctrl,
-            "timestamp": time.time()
+            "timestamp": timestamp_us()
         }
-        with open(COMMAND_FILE, 'w') as f:
-            json.dump(cmd, f)
-        print(f"[*] Wrote command: delta={delta}")
-    except Exception as e:
-        print(f"[!] Error writing command file: {e}")
+        overwrite_file(COMMAND_FILE, json_dumps(cmd))
+        log.debug("[*] Wrote command: delta=%s", delta)
+    except OSError as e:
+        log.error("[!] Error writing command file: %s", e)
+
+
+# (x, y) last written to POSITION_FILE (only touched on the file writer thread)
+_last_saved_position = None
 
 
-def write_position_file(delta, ctrl="BIG"):
-    """Write accumulated position to file for AE expression to read"""
-    global accumulated_position
+def save_position_file(position):
+    """Write a position snapshot to file for AE expression to read"""
+    global _last_saved_position
+    pos = (position["x"], position["y"])
+    if pos == _last_saved_position:
+        return  # Deltas cancelled out within the flush window
+    _last_saved_position = pos
     try:
-        # Accumulate based on control type
-        if ctrl == "BIG":
-            accumulated_position["x"] += delta
-        else:
-            accumulated_position["y"] += delta
-        
-        # Write atomically with timestamp
-        out = dict(accumulated_position)
-        out["_ts"] = time.time()
-        tmp = POSITION_FILE + ".tmp"
-        with open(tmp, 'w') as f:
-            json.dump(out, f)
+        out = dict(position)
+        out["_ts"] = timestamp_us()
+        # In place like the command file: the AE reader trims the padding
+        overwrite_file(POSITION_FILE, json_dumps(out))
+        log.debug("[*] Position: x=%s, y=%s", position['x'], position['y'])
+    except OSError as e:
+        log.error("[!] Error writing position file: %s", e)
+
+
+# Dial/scroller file writes are coalesced: the bridge only updates memory and
+# sets dial_dirty; dial_flusher writes the latest command, position and
+# controller state at most once per DIAL_FLUSH_INTERVAL, from the file
+# writer thread.
+DIAL_FLUSH_INTERVAL = 0.016
+DIAL_FLUSH_MAX_TICKS = 8  # Flush early once this many ticks are pending
+last_dial_command = None  # (delta, ctrl) of the most recent dial event
+dial_dirty = None         # asyncio.Event, created in start_dial_flusher
+dial_batch_full = None    # asyncio.Event, created in start_dial_flusher
+dial_pending_ticks = 0
+
+
+def _write_dial_files(command, position):
+    # One executor job per flush covers every file a dial event touches, and
+    # each of them is a single pwrite on a descriptor that stays open (no
+    # open/rename/close cycle per file)
+    write_command_file(*command)
+    save_position_file(position)
+    write_state_file_now()
+
+
+async def dial_flusher():
+    """Background task: flush coalesced dial/scroller state to disk."""
+    global dial_pending_ticks
+    loop = asyncio.get_running_loop()
+    while True:
+        await dial_dirty.wait()
+        # Whichever comes first: the flush interval or a full batch of ticks
+        try:
+            await asyncio.wait_for(dial_batch_full.wait(), DIAL_FLUSH_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+        dial_dirty.clear()
+        dial_batch_full.clear()
+        dial_pending_ticks = 0
         try:
-            os.replace(tmp, POSITION_FILE)
+            await loop.run_in_executor(
+                _FILE_POOL, _write_dial_files, last_dial_command, dict(accumulated_position)
+            )
         except Exception:
-            # fallback
-            with open(POSITION_FILE, 'w') as f:
-                json.dump(out, f)
-        print(f"[*] Position: x={accumulated_position['x']}, y={accumulated_position['y']}")
-    except Exception as e:
-        print(f"[!] Error writing position file: {e}")
+            # A bad flush must not end the task: later ticks still need writing
+            log.exception("[!] Dial flush failed")
+
+
+async def start_dial_flusher(app):
+    """aiohttp on_startup hook: start the dial file flusher task."""
+    global dial_dirty, dial_batch_full
+    dial_dirty = asyncio.Event()
+    dial_batch_full = asyncio.Event()
+    app['dial_flusher'] = asyncio.create_task(dial_flusher())
+
+
+async def stop_dial_flusher(app):
+    """aiohttp on_cleanup hook: stop the dial file flusher task."""
+    app['dial_flusher'].cancel()
 
 
 def write_button_file(button_name, pressed):
     """Write button state to file for ExtendScript to read"""
     try:
+        ts = timestamp_us()
         btn_data = {
             "button": button_name,
             "pressed": pressed,
-            "timestamp": time.time(),
-            "_ts": time.time()
+            "timestamp": ts,
+            "_ts": ts
         }
-        tmp = BUTTON_FILE + ".tmp"
-        with open(tmp, 'w') as f:
-            json.dump(btn_data, f)
-        try:
-            os.replace(tmp, BUTTON_FILE)
-        except Exception:
-            with open(BUTTON_FILE, 'w') as f:
-                json.dump(btn_data, f)
-    except Exception as e:
-        print(f"[!] Error writing button file: {e}")
+        overwrite_file(BUTTON_FILE, json_dumps(btn_data))
+    except OSError as e:
+        log.error("[!] Error writing button file: %s", e)
 
 
 # Keep small and self-contained: copy of the HTML UI used previously
@@ -662,6 +863,8 @@ HTML_CONTENT = """
 
     <script>
         const ws = new WebSocket("ws://" + window.location.host + "/ws");
+        ws.binaryType = "arraybuffer";
+        const decoder = new TextDecoder();
         
         let dialRotation = 0;
         let scrollPosition = 0;
@@ -688,8 +891,26 @@ HTML_CONTENT = """
             "BOTTOM RIGHT": document.getElementById('btn-br')
         };
 
+        function applyMidiCC(data) {
+            const cc = data.cc;
+            const pct = data.normalized;
+            const el = document.getElementById('midi-cc-' + cc);
+            if (el) {
+                if (el.classList.contains('midi-fader')) {
+                    // Fader: set fill height
+                    const fill = el.querySelector('.midi-fader-fill');
+                    if (fill) fill.style.setProperty('--pct', pct + '%');
+                } else {
+                    // Knob: set conic gradient percentage
+                    el.style.setProperty('--pct', (pct * 2.8) + 'deg'); // 280deg sweep
+                }
+            }
+        }
+
         ws.onmessage = (event) => {
-            const data = JSON.parse(event.data);
+            const data = JSON.parse(
+                typeof event.data === "string" ? event.data : decoder.decode(event.data)
+            );
             const delta = data.delta || 0;
             
             // Handle keypad button events (BTN ctrl with numeric name like "1", "2", etc.)
@@ -739,19 +960,11 @@ HTML_CONTENT = """
             }
             // Handle MIDI CC events (knobs and faders)
             else if (data.ctrl === "MIDI_CC") {
-                const cc = data.cc;
-                const pct = data.normalized;
-                const el = document.getElementById('midi-cc-' + cc);
-                if (el) {
-                    if (el.classList.contains('midi-fader')) {
-                        // Fader: set fill height
-                        const fill = el.querySelector('.midi-fader-fill');
-                        if (fill) fill.style.setProperty('--pct', pct + '%');
-                    } else {
-                        // Knob: set conic gradient percentage
-                        el.style.setProperty('--pct', (pct * 2.8) + 'deg'); // 280deg sweep
-                    }
-                }
+                applyMidiCC(data);
+            }
+            // Several CC events coalesced by the server into one frame
+            else if (data.ctrl === "MIDI_CC_BATCH") {
+                data.events.forEach(applyMidiCC);
             }
             // Handle MIDI Note events (buttons)
             else if (data.ctrl === "MIDI_NOTE") {
@@ -774,203 +987,684 @@ HTML_CONTENT = """
 </html>
 """
 
-CONNECTED_CLIENTS = set()
+_SCRIPT_RE = re.compile(r'(<script\b.*?</script>)', re.S | re.I)
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+_WHITESPACE_RE = re.compile(r'\s+')
 
-async def broadcast_to_browsers(payload):
-    # payload is a JSON string
-    for ws in list(CONNECTED_CLIENTS):
+
+def minify_html(html):
+    """Drop CSS comments and collapse whitespace, leaving <script> blocks as is.
+
+    Whitespace between and inside tags renders the same collapsed; scripts are
+    skipped because newlines end `//` comments there.
+    """
+    parts = _SCRIPT_RE.split(html)
+    for i in range(0, len(parts), 2):
+        parts[i] = _WHITESPACE_RE.sub(' ', _CSS_COMMENT_RE.sub('', parts[i]))
+    return ''.join(parts).strip()
+
+
+# The page is static: minify, encode, compress and fingerprint it once at import
+HTML_BYTES = minify_html(HTML_CONTENT).encode('utf-8')
+del HTML_CONTENT  # Only the encoded copies are served
+# mtime=0 keeps the compressed bytes identical from run to run
+HTML_GZ = gzip.compress(HTML_BYTES, 9, mtime=0)
+HTML_ETAG = '"' + hashlib.blake2b(HTML_BYTES, digest_size=8).hexdigest() + '"'
+
+# Response headers are fixed too (a Response object itself cannot be re-sent)
+_HTML_HEADERS = CIMultiDict({
+    'Content-Type': 'text/html; charset=utf-8',
+    'ETag': HTML_ETAG,
+    'Vary': 'Accept-Encoding',
+    'Cache-Control': 'no-cache',  # Revalidate: a reload costs a 304, not the page
+})
+_HTML_GZ_HEADERS = CIMultiDict(_HTML_HEADERS)
+_HTML_GZ_HEADERS['Content-Encoding'] = 'gzip'
+_HTML_304_HEADERS = CIMultiDict({'ETag': HTML_ETAG, 'Cache-Control': 'no-cache'})
+
+# Browser websockets, as the outbox (outgoing queue) of each one.
+# Copy-on-write tuple: clients come and go rarely while every event is
+# broadcast, so the broadcast reads an immutable snapshot for free and
+# registration pays for the copy.
+CONNECTED_CLIENTS = ()
+
+# Frames a browser may fall behind by before its oldest queued frame is dropped
+CLIENT_QUEUE_SIZE = 256
+
+
+def add_client(outbox):
+    global CONNECTED_CLIENTS
+    CONNECTED_CLIENTS = CONNECTED_CLIENTS + (outbox,)
+
+
+def remove_client(outbox):
+    global CONNECTED_CLIENTS
+    if outbox in CONNECTED_CLIENTS:
+        CONNECTED_CLIENTS = tuple(c for c in CONNECTED_CLIENTS if c is not outbox)
+
+
+def broadcast_to_browsers(payload):
+    """Queue payload for every browser; never waits on a slow client.
+
+    payload is UTF-8 encoded JSON bytes, encoded once and shared by all
+    clients. Each browser's client_sender task does the actual sending, so a
+    stalled tab only backs up its own outbox, where the oldest frame gives
+    way to the newest.
+    """
+    for outbox in CONNECTED_CLIENTS:
+        try:
+            outbox.put_nowait(payload)
+        except asyncio.QueueFull:
+            outbox.get_nowait()
+            outbox.put_nowait(payload)
+
+
+async def client_sender(ws, outbox):
+    """Background task per browser: send its queued frames in order."""
+    while True:
+        payload = await outbox.get()
         try:
-            await ws.send_str(payload)
+            await ws.send_bytes(payload)
         except Exception:
-            try:
-                CONNECTED_CLIENTS.remove(ws)
-            except Exception:
-                pass
+            # Closing: stop queueing frames for it right away rather than
+            # when websocket_handler sees the close (remove_client is idempotent)
+            remove_client(outbox)
+            return
+
+
+_WS_CLOSE_TYPES = (
+    web.WSMsgType.CLOSE, web.WSMsgType.CLOSING, web.WSMsgType.CLOSED, web.WSMsgType.ERROR,
+)
+
+
+async def wait_for_close(ws):
+    """Park a send-only websocket until the peer goes away.
+
+    Browsers never send data frames and ping/pong is answered inside
+    aiohttp, so receive() only wakes us for the close handshake (which
+    aiohttp can only process while a receive is pending).
+    """
+    while True:
+        msg = await ws.receive()
+        if msg.type in _WS_CLOSE_TYPES:
+            return
+
+
+# Shared by the browser and bridge endpoints. The heartbeat pings idle peers
+# so a vanished browser is closed (and unregistered) within ~30 s instead of
+# lingering until a broadcast fails on it. Incoming frames are single events
+# of well under 1 KiB, so anything past 64 KiB (aiohttp allows 4 MiB) is a
+# rogue peer and closes the connection instead of being buffered.
+WS_OPTIONS = dict(heartbeat=20.0, autoping=True, compress=False, max_msg_size=65536)
 
 
 async def websocket_handler(request):
-    ws = web.WebSocketResponse()
+    # No permessage-deflate: events are tiny, and with it every send_bytes()
+    # of the shared frame would be compressed again for each browser
+    ws = web.WebSocketResponse(**WS_OPTIONS)
     await ws.prepare(request)
-    CONNECTED_CLIENTS.add(ws)
+    outbox = asyncio.Queue(CLIENT_QUEUE_SIZE)
+    sender = asyncio.create_task(client_sender(ws, outbox))
+    add_client(outbox)
     try:
-        async for msg in ws:  # Keep socket open; we do not expect incoming messages from browser
-            pass
+        await wait_for_close(ws)
     finally:
+        remove_client(outbox)
+        sender.cancel()
+    return ws
+
+
+# Last value relayed per MIDI CC number. A CC carries a level, so a repeat of
+# the same value changes nothing and is dropped; edge events (buttons, keys,
+# notes) are never deduplicated, a second identical press is a real press
+_last_cc_value = {}
+
+# Dial/scroller ticks are most of the traffic and always have this exact shape
+# (host.py sends {"ctrl": "BIG"|"SMALL", "delta": n}); they skip the JSON parse
+_DIAL_EVENT_RE = re.compile(
+    rb'\{\s*"ctrl"\s*:\s*"(BIG|SMALL)"\s*,\s*"delta"\s*:\s*(-?\d+)\s*\}'
+)
+_DIAL_CTRL = {b'BIG': 'BIG', b'SMALL': 'SMALL'}
+_match_dial_event = _DIAL_EVENT_RE.fullmatch  # Bound once for the hot path
+
+
+# Largest delta a single tick may carry; the HID reports a signed byte, so
+# anything larger is a malformed event (and could overflow the JSON encoder)
+MAX_DIAL_DELTA = 127
+
+
+def apply_dial_delta(ctrl, delta):
+    """Record one dial/scroller tick; files are written by the dial flusher.
+
+    Returns the delta as applied (clamped to +/-MAX_DIAL_DELTA).
+    """
+    global last_dial_command, _status_dirty, _position_dirty, dial_pending_ticks
+    if type(delta) is float and not math.isfinite(delta):
+        raise ValueError(f"non-finite dial delta: {delta!r}")
+    delta = max(-MAX_DIAL_DELTA, min(MAX_DIAL_DELTA, int(delta)))
+    last_slider_state["ctrl"] = ctrl
+    last_slider_state["delta"] = delta
+    _status_dirty = _position_dirty = True
+    last_dial_command = (delta, ctrl)
+    dial_dirty.set()
+    dial_pending_ticks += 1
+    if dial_pending_ticks >= DIAL_FLUSH_MAX_TICKS:
+        dial_batch_full.set()
+    # Accumulate the position (BIG -> x, anything else -> y) and update the
+    # controller state for ComfyUI in one branch on ctrl; the state file is
+    # written by the same coalesced dial flush
+    if ctrl == 'BIG':
+        accumulated_position["x"] += delta
+        with state_lock:
+            controller_state["dial_value"] += delta
+            controller_state["dial_delta"] = delta
+    else:
+        accumulated_position["y"] += delta
+        if ctrl == 'SMALL':
+            with state_lock:
+                controller_state["scroller_value"] += delta
+                controller_state["scroller_delta"] = delta
+    return delta
+
+
+# Controller state keys for the dialpad's four buttons (ComfyUI)
+BTN_STATE_KEYS = {
+    "TOP LEFT": "btn_top_left",
+    "TOP RIGHT": "btn_top_right",
+    "BOTTOM LEFT": "btn_bottom_left",
+    "BOTTOM RIGHT": "btn_bottom_right"
+}
+
+# Controller state keys for keypad buttons 1-9, indexed by button number - 1
+KEYPAD_STATE_KEYS = tuple(sys.intern(f"btn_{i}") for i in range(1, 10))
+
+# Raw LCXL notes 105-108 map to auxiliary toggles for AE
+AUX_NOTE_KEYS = {105: 'aux_1', 106: 'aux_2', 107: 'aux_3', 108: 'aux_4'}
+
+
+def _handle_btn(data):
+    """Dialpad button event (ctrl: "BTN", name: "...", state: "PRESSED"/"RELEASED")."""
+    global button_mask, _status_dirty
+    button_name = data.get('name', '')
+    pressed = data.get('state') == 'PRESSED'
+    bit = BTN_BIT.get(button_name, 0)
+    if bit:
+        button_mask = (button_mask | bit) if pressed else (button_mask & ~bit)
+        last_slider_state["buttons"] = button_mask
+        _status_dirty = True
+        log.debug("[*] Button: %s %s", button_name, 'PRESSED' if pressed else 'RELEASED')
+        # Write to file for ExtendScript
+        submit_file_write(write_button_file, button_name, pressed)
+        # Update controller state for ComfyUI
+        update_controller_state(BTN_STATE_KEYS[button_name], pressed, force=True)
+
+
+def _handle_keypad(data):
+    """Keypad button event (ctrl: "KEYPAD", button: 1-9, state: "PRESSED"/"RELEASED")."""
+    button_num = data.get('button', 0)
+    button_name = str(button_num)  # "1", "2", etc.
+    pressed = data.get('state') == 'PRESSED'
+    log.debug("[*] Keypad: %s %s", button_name, 'PRESSED' if pressed else 'RELEASED')
+    # Write to file for ExtendScript
+    submit_file_write(write_button_file, button_name, pressed)
+    # Update controller state for ComfyUI
+    if 1 <= button_num <= 9:
+        update_controller_state(KEYPAD_STATE_KEYS[button_num - 1], pressed, force=True)
+
+
+def _handle_dial(data):
+    """Dial/scroller event that did not match the fast path (extra fields)."""
+    apply_dial_delta(data.get('ctrl', 'BIG'), data.get('delta', 0))
+
+
+# MIDI CC value (0-127) -> controller state percentage, computed once
+CC_PERCENT = {val: (val / 127.0) * 100.0 for val in range(128)}
+
+# CC name -> controller state key ("FADER_3" -> "fader_3", "KNOB_1A" -> "knob_1a"),
+# None for CCs without one; filled in the first time each name is seen
+_CC_STATE_KEYS = {}
+
+
+def _fader_state_key(suffix):
+    return f"fader_{suffix}"  # "3" -> "fader_3"
+
+
+def _knob_state_key(suffix):
+    # Suffix is number + row letter: "1A" -> "knob_1a"
+    return f"knob_{suffix[:-1]}{suffix[-1].lower()}"
+
+
+# Token before the first "_" of a CC name -> builder of its state key
+_CC_KEY_BUILDERS = {"FADER": _fader_state_key, "KNOB": _knob_state_key}
+
+
+def _cc_state_key(name):
+    prefix, _, suffix = name.partition("_")
+    build = _CC_KEY_BUILDERS.get(prefix)
+    key = build(suffix) if build is not None and suffix else None
+    if len(_CC_STATE_KEYS) < 1024:  # Names come off the wire; keep it bounded
+        _CC_STATE_KEYS[name] = key
+    return key
+
+
+def _handle_midi_cc(data):
+    """MIDI CC event (LCXL faders and knobs)."""
+    val = data.get('value', 0)
+    name = data.get('name')
+    if name is None:
+        name = f"CC_{data.get('cc', 0)}"
+    log.debug("[*] MIDI CC: %s = %s", name, val)
+    # Update controller state for ComfyUI
+    key = _CC_STATE_KEYS[name] if name in _CC_STATE_KEYS else _cc_state_key(name)
+    if key is not None:
+        # Convert 0-127 to 0.0-100.0
+        pct = CC_PERCENT.get(val)
+        if pct is None:  # Out of MIDI range (or not a number): compute it
+            pct = (val / 127.0) * 100.0
+            if not math.isfinite(pct):  # Infinity/NaN would make /state invalid JSON
+                raise ValueError(f"non-finite CC value: {val!r}")
+        update_controller_state(key, pct)
+
+
+# Note name group -> controller state key prefix
+_NOTE_KEY_PREFIXES = {"BTN_FOCUS": "focus_", "BTN_CTRL": "ctrl_"}
+
+# Note name -> controller state key ("BTN_FOCUS_3" -> "focus_3",
+# "Note_105" -> "aux_1"), None for notes without one; same scheme as
+# _CC_STATE_KEYS
+_NOTE_STATE_KEYS = {}
+
+
+def _note_state_key(name):
+    # One split: "BTN_FOCUS_3" -> ("BTN_FOCUS", "3"), "Note_105" -> ("Note", "105")
+    group, _, num = name.rpartition('_')
+    key = None
+    if group == 'Note':
+        # Map certain raw note numbers to auxiliary toggles for AE
         try:
-            CONNECTED_CLIENTS.remove(ws)
-        except Exception:
+            key = AUX_NOTE_KEYS.get(int(num))
+        except ValueError:
             pass
-    return ws
+    else:
+        # BTN_FOCUS_1 through BTN_FOCUS_8, BTN_CTRL_1 through BTN_CTRL_8
+        prefix = _NOTE_KEY_PREFIXES.get(group)
+        if prefix is not None and num:
+            key = prefix + num
+    if len(_NOTE_STATE_KEYS) < 1024:  # Names come off the wire; keep it bounded
+        _NOTE_STATE_KEYS[name] = key
+    return key
+
+
+# Build the keys of every LCXL control up front, so the hot path is a single
+# dict lookup that never formats a string, even on a control's first event
+for _n in range(1, 9):
+    _cc_state_key(f"FADER_{_n}")
+    for _row in "ABC":
+        _cc_state_key(f"KNOB_{_n}{_row}")
+    _note_state_key(f"BTN_FOCUS_{_n}")
+    _note_state_key(f"BTN_CTRL_{_n}")
+for _n in AUX_NOTE_KEYS:
+    _note_state_key(f"Note_{_n}")
+del _n, _row
+
+
+def _handle_midi_note(data):
+    """MIDI Note event (LCXL buttons)."""
+    state = data.get('state', 'OFF')
+    name = data.get('name')
+    if name is None:
+        name = f"Note_{data.get('note', 0)}"
+    pressed = (state == 'ON')
+    log.debug("[*] MIDI Note: %s = %s", name, state)
+    # Update controller state for ComfyUI (focus/ctrl) and AE (aux)
+    key = _NOTE_STATE_KEYS[name] if name in _NOTE_STATE_KEYS else _note_state_key(name)
+    if key is not None:
+        update_controller_state(key, pressed, force=True)
+
+
+# Continuous controls reach the browsers at most once per flush interval
+# (about one display frame): a fader sweep or a fast dial spin sends dozens of
+# events per second, and a browser only needs the latest value of each.
+# MIDI CC events are relayed as one batch frame, newest value per CC; dial
+# and scroller ticks are summed into one delta per control.
+RELAY_FLUSH_INTERVAL = 0.016
+_pending_cc = {}      # cc number -> latest raw JSON payload, until the next flush
+_pending_dial = {}    # 'BIG'/'SMALL' -> summed delta, until the next flush
+relay_pending = None  # asyncio.Event, created in start_relay_flusher
+
+# Relayed dial/scroller frame per control, in the shape host.py sends
+_DIAL_FRAME = {
+    'BIG': b'{"ctrl":"BIG","delta":%d}',
+    'SMALL': b'{"ctrl":"SMALL","delta":%d}',
+}
+
+
+def queue_midi_cc(cc, payload):
+    # Last write wins: within one flush only a control's final value matters
+    _pending_cc[cc] = payload
+    relay_pending.set()
+
+
+def queue_dial_delta(ctrl, delta):
+    # Deltas are relative, so coalescing sums them
+    _pending_dial[ctrl] = _pending_dial.get(ctrl, 0) + delta
+    relay_pending.set()
+
+
+async def relay_flusher():
+    """Background task: relay coalesced CC and dial events to the browsers."""
+    global _pending_cc, _pending_dial
+    while True:
+        await relay_pending.wait()
+        await asyncio.sleep(RELAY_FLUSH_INTERVAL)
+        relay_pending.clear()
+        dial, _pending_dial = _pending_dial, {}
+        for ctrl, delta in dial.items():
+            if delta:  # Ticks that cancelled out move nothing
+                broadcast_to_browsers(_DIAL_FRAME[ctrl] % delta)
+        batch, _pending_cc = _pending_cc, {}
+        if len(batch) == 1:
+            broadcast_to_browsers(next(iter(batch.values())))
+        elif batch:
+            # The events are already JSON; splice them into the batch as-is
+            broadcast_to_browsers(
+                b'{"ctrl":"MIDI_CC_BATCH","events":[' + b','.join(batch.values()) + b']}'
+            )
+
+
+async def start_relay_flusher(app):
+    """aiohttp on_startup hook: start the browser relay flusher task."""
+    global relay_pending
+    relay_pending = asyncio.Event()
+    app['relay_flusher'] = asyncio.create_task(relay_flusher())
+
+
+async def stop_relay_flusher(app):
+    """aiohttp on_cleanup hook: stop the browser relay flusher task."""
+    app['relay_flusher'].cancel()
+
+
+# ctrl value -> handler; events without a known ctrl but with a delta are dials
+_EVENT_HANDLERS = {
+    'BTN': _handle_btn,
+    'KEYPAD': _handle_keypad,
+    'MIDI_CC': _handle_midi_cc,
+    'MIDI_NOTE': _handle_midi_note,
+}
+
+
+def handle_bridge_payload(payload):
+    """Update global state from one host event and relay it to browsers.
+
+    Shared by the websocket bridge and the UDP bridge endpoint.
+    payload is the raw JSON event as bytes (or str, which is encoded once),
+    or a raw MIDI message (see handle_midi_frame).
+    """
+    if isinstance(payload, str):
+        payload = payload.encode('utf-8')
+    if payload and payload[0] >= 0x80:
+        handle_midi_frame(payload)  # Raw MIDI status byte; JSON starts with '{'
+        return
+    m = _match_dial_event(payload)
+    if m is not None:
+        ctrl = _DIAL_CTRL[m.group(1)]
+        delta = apply_dial_delta(ctrl, int(m.group(2)))
+        queue_dial_delta(ctrl, delta)  # Relayed by relay_flusher
+        return
+    try:
+        data = json_loads(payload)
+    except ValueError:
+        data = None  # Malformed JSON (both codecs raise a ValueError subclass)
+    # Update global state and write to files; anything that is not a JSON
+    # object is relayed untouched
+    if type(data) is dict:
+        ctrl = data.get('ctrl')
+        if type(ctrl) is str:
+            handler = _EVENT_HANDLERS.get(ctrl)
+        elif ctrl is None:
+            handler = None  # A bare {"delta": n} is a BIG dial tick
+        else:
+            # Not a name (list, object, number): nothing to dispatch on, and
+            # an unhashable ctrl must not reach the dict lookup
+            broadcast_to_browsers(payload)
+            return
+        if handler is _handle_midi_cc:
+            cc = data.get('cc')
+            if type(cc) is int and 0 <= cc <= 0x7F:
+                value = data.get('value')
+                if cc in _last_cc_value and _last_cc_value[cc] == value:
+                    return  # Same level again
+                if _apply_event(handler, data):
+                    _last_cc_value[cc] = value
+                    queue_midi_cc(cc, payload)  # Relayed by relay_flusher
+                    return
+            else:
+                _apply_event(handler, data)
+        elif handler is not None:
+            _apply_event(handler, data)
+        elif 'delta' in data:
+            _apply_event(_handle_dial, data)
+    # Relay to any connected browser clients
+    broadcast_to_browsers(payload)
+
+
+def _apply_event(handler, data):
+    """Run an event handler; False if the event had fields of the wrong type."""
+    try:
+        handler(data)
+    except (ValueError, KeyError, IndexError, TypeError, AttributeError, OverflowError):
+        # e.g. a non-numeric value or a non-string name; nothing to apply
+        log.debug("[-] Ignored malformed event: %r", data)
+        return False
+    return True
+
+
+def handle_midi_frame(frame):
+    """Apply one raw MIDI message from host.py and relay it to browsers as JSON.
+
+    host.py sends CC messages as their 3 MIDI bytes (status, cc, value); the
+    control's name and the MIDI_CC event come from the tables in midi_map.py.
+    """
+    if len(frame) != 3 or frame[0] & 0xF0 != 0xB0 or (frame[1] | frame[2]) > 0x7F:
+        log.debug("[-] Ignored MIDI frame: %s", frame.hex())
+        return
+    cc = frame[1]
+    val = frame[2]
+    if cc in _last_cc_value and _last_cc_value[cc] == val:
+        return  # Same level again
+    _last_cc_value[cc] = val
+    name = MIDI_CC_NAMES[cc]
+    log.debug("[*] MIDI CC: %s = %s", name, val)
+    # Update controller state for ComfyUI
+    key = _CC_STATE_KEYS[name] if name in _CC_STATE_KEYS else _cc_state_key(name)
+    if key is not None:
+        update_controller_state(key, CC_PERCENT[val])
+    queue_midi_cc(cc, midi_cc_event(cc, val))  # Relayed by relay_flusher
 
 
 async def bridge_handler(request):
-    # Sender (visualizer.py) connects here and sends JSON messages to be relayed to browsers
-    ws = web.WebSocketResponse()
+    # Sender (host.py) connects here and sends JSON messages to be relayed to browsers
+    # (uncompressed, so no inflate per incoming event)
+    ws = web.WebSocketResponse(**WS_OPTIONS)
     await ws.prepare(request)
     peer = request.remote
-    print(f"[*] Bridge connected from {peer}")
+    log.info("[*] Bridge connected from %s", peer)
     try:
         async for msg in ws:
-            if msg.type == web.WSMsgType.TEXT:
-                payload = msg.data
-                # Update global state and write to files
-                try:
-                    data = json.loads(payload)
-                    
-                    # Handle dialpad button events (ctrl: "BTN", name: "...", state: "PRESSED"/"RELEASED")
-                    if data.get('ctrl') == 'BTN':
-                        button_name = data.get('name', '')
-                        pressed = data.get('state') == 'PRESSED'
-                        if button_name in button_states:
-                            button_states[button_name] = pressed
-                            print(f"[*] Button: {button_name} {'PRESSED' if pressed else 'RELEASED'}")
-                            # Write to file for ExtendScript
-                            write_button_file(button_name, pressed)
-                            # Update controller state for ComfyUI
-                            state_key_map = {
-                                "TOP LEFT": "btn_top_left",
-                                "TOP RIGHT": "btn_top_right",
-                                "BOTTOM LEFT": "btn_bottom_left",
-                                "BOTTOM RIGHT": "btn_bottom_right"
-                            }
-                            if button_name in state_key_map:
-                                update_controller_state(state_key_map[button_name], pressed)
-                    
-                    # Handle keypad button events (ctrl: "KEYPAD", button: 1-9, state: "PRESSED"/"RELEASED")
-                    elif data.get('ctrl') == 'KEYPAD':
-                        button_num = data.get('button', 0)
-                        button_name = str(button_num)  # "1", "2", etc.
-                        pressed = data.get('state') == 'PRESSED'
-                        print(f"[*] Keypad: {button_name} {'PRESSED' if pressed else 'RELEASED'}")
-                        # Write to file for ExtendScript
-                        write_button_file(button_name, pressed)
-                        # Update controller state for ComfyUI
-                        if 1 <= button_num <= 9:
-                            update_controller_state(f"btn_{button_num}", pressed)
-                    
-                    # Handle dial/scroller events
-                    elif 'delta' in data:
-                        last_slider_state.update(data)
-                        ctrl = data.get('ctrl', 'BIG')
-                        delta = data.get('delta', 0)
-                        write_command_file(delta, ctrl)
-                        write_position_file(delta, ctrl)
-                        # Update controller state for ComfyUI
-                        if ctrl == 'BIG':
-                            with state_lock:
-                                controller_state["dial_value"] += delta
-                                controller_state["dial_delta"] = delta
-                            write_state_file()
-                        elif ctrl == 'SMALL':
-                            with state_lock:
-                                controller_state["scroller_value"] += delta
-                                controller_state["scroller_delta"] = delta
-                            write_state_file()
-                    
-                    # Handle MIDI CC events
-                    elif data.get('ctrl') == 'MIDI_CC':
-                        cc = data.get('cc', 0)
-                        val = data.get('value', 0)
-                        name = data.get('name', f'CC_{cc}')
-                        print(f"[*] MIDI CC: {name} = {val}")
-                        # Update controller state for ComfyUI
-                        # Convert 0-127 to 0.0-100.0
-                        normalized = (val / 127.0) * 100.0
-                        # Map CC to state key based on name pattern
-                        if name.startswith("FADER_"):
-                            fader_num = name.split("_")[1]
-                            update_controller_state(f"fader_{fader_num}", normalized)
-                        elif name.startswith("KNOB_"):
-                            # Format is "KNOB_1A" - extract number and letter
-                            suffix = name.split("_")[1]  # e.g., "1A"
-                            knob_num = suffix[:-1]  # e.g., "1"
-                            row = suffix[-1].lower()  # e.g., "a"
-                            update_controller_state(f"knob_{knob_num}{row}", normalized)
-                    
-                    # Handle MIDI Note events (LCXL buttons)
-                    elif data.get('ctrl') == 'MIDI_NOTE':
-                        note = data.get('note', 0)
-                        state = data.get('state', 'OFF')
-                        name = data.get('name', f'Note_{note}')
-                        pressed = (state == 'ON')
-                        print(f"[*] MIDI Note: {name} = {state}")
-                        # Map certain raw note numbers to auxiliary toggles for AE
-                        try:
-                            if name.startswith('Note_'):
-                                note_num = int(name.split('_')[1])
-                                # Map Note 105-108 to aux_1..aux_4
-                                aux_map = {105: 'aux_1', 106: 'aux_2', 107: 'aux_3', 108: 'aux_4'}
-                                if note_num in aux_map:
-                                    update_controller_state(aux_map[note_num], pressed)
-                        except Exception:
-                            pass
-                        # Update controller state for ComfyUI
-                        # BTN_FOCUS_1 through BTN_FOCUS_8, BTN_CTRL_1 through BTN_CTRL_8
-                        if name.startswith("BTN_FOCUS_"):
-                            btn_num = name.split("_")[2]
-                            update_controller_state(f"focus_{btn_num}", pressed)
-                        elif name.startswith("BTN_CTRL_"):
-                            btn_num = name.split("_")[2]
-                            update_controller_state(f"ctrl_{btn_num}", pressed)
-                except:
-                    pass
-                # Relay to any connected browser clients
-                await broadcast_to_browsers(payload)
+            # host.py sends UTF-8 JSON (or raw MIDI CC bytes) in binary
+            # frames; text frames still work
+            if msg.type in (web.WSMsgType.BINARY, web.WSMsgType.TEXT):
+                handle_bridge_payload(msg.data)
             elif msg.type == web.WSMsgType.ERROR:
-                print('ws connection closed with exception %s' % ws.exception())
+                log.warning('ws connection closed with exception %s', ws.exception())
     finally:
-        print(f"[*] Bridge disconnected from {peer}")
+        log.info("[*] Bridge disconnected from %s", peer)
     return ws
 
 
+class BridgeDatagramProtocol(asyncio.DatagramProtocol):
+    """UDP bridge endpoint: one event per datagram (host.py --udp).
+
+    Each datagram is handled as it arrives, on the event loop, so events
+    are applied in arrival order exactly like the websocket bridge.
+    """
+
+    def datagram_received(self, data, addr):
+        handle_bridge_payload(data)
+
+    def error_received(self, exc):
+        log.warning("[-] UDP bridge error: %s", exc)
+
+
+async def start_udp_bridge(app):
+    """aiohttp on_startup hook: listen for UDP bridge datagrams on WEB_PORT."""
+    loop = asyncio.get_running_loop()
+    bind_host = app.get('bind_host', '127.0.0.1')
+    try:
+        transport, _ = await loop.create_datagram_endpoint(
+            BridgeDatagramProtocol, local_addr=(bind_host, WEB_PORT)
+        )
+    except OSError as e:
+        log.warning("[-] UDP bridge disabled: %s", e)
+        return
+    app['udp_transport'] = transport
+    log.info("[*] UDP bridge listening on %s:%s", bind_host, WEB_PORT)
+
+
+async def stop_udp_bridge(app):
+    """aiohttp on_cleanup hook: close the UDP bridge endpoint."""
+    transport = app.get('udp_transport')
+    if transport is not None:
+        transport.close()
+
+
+def json_response(obj):
+    """JSON HTTP response encoded with json_dumps (web.json_response re-encodes a str)."""
+    return web.Response(body=json_dumps(obj), content_type='application/json')
+
+
 async def status_handler(request):
     """HTTP endpoint for scripts to poll current slider state"""
-    return web.json_response(last_slider_state)
+    global _status_cache, _status_dirty
+    if _status_dirty:
+        _status_cache = json_dumps(last_slider_state)
+        _status_dirty = False
+    return web.Response(body=_status_cache, content_type='application/json')
+
+
+async def position_handler(request):
+    """HTTP endpoint serving the live accumulated position straight from memory.
+
+    Same data as POSITION_FILE, minus the file: a consumer that can poll HTTP
+    sees every tick without waiting for the dial flush or touching the disk.
+    Cached like /status between changes.
+    """
+    global _position_cache, _position_dirty
+    if _position_dirty:
+        _position_cache = json_dumps(accumulated_position)
+        _position_dirty = False
+    return web.Response(body=_position_cache, content_type='application/json')
 
 
 async def reset_position_handler(request):
     """Reset accumulated position to zero"""
-    global accumulated_position
+    global accumulated_position, _position_dirty
     accumulated_position = {"x": 0, "y": 0}
-    write_position_file(0, "RESET")
-    return web.json_response({"status": "ok", "position": accumulated_position})
+    _position_dirty = True
+    await asyncio.get_running_loop().run_in_executor(
+        _FILE_POOL, save_position_file, dict(accumulated_position)
+    )
+    return json_response({"status": "ok", "position": accumulated_position})
 
 
 async def index_handler(request):
-    return web.Response(text=HTML_CONTENT, content_type='text/html')
-
-
-def state_flush_thread():
-    """Background thread that periodically flushes dirty state to file."""
-    while True:
-        time.sleep(0.016)  # ~60fps
-        write_state_file_throttled()
+    # Substring test also matches lists ("a", "b") and weak W/"..." validators
+    if HTML_ETAG in request.headers.get('If-None-Match', ''):
+        return web.Response(status=304, headers=_HTML_304_HEADERS)
+    if 'gzip' in request.headers.get('Accept-Encoding', ''):
+        return web.Response(body=HTML_GZ, headers=_HTML_GZ_HEADERS)
+    return web.Response(body=HTML_BYTES, headers=_HTML_HEADERS)
+
+
+def setup_logging(debug=False):
+    """Route log records through a queue to a console handler on its own thread.
+
+    The event loop and the file writer thread only enqueue records; the
+    console write (slow on a Windows terminal) happens on the listener thread.
+    """
+    records = queue.SimpleQueue()
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(records, console)
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(records))
+    root.setLevel(logging.DEBUG if debug else logging.INFO)
+    listener.start()
+    atexit.register(listener.stop)  # Flushes whatever is still queued
+    return listener
+
+
+def warm_up():
+    """Run the per-event codec and matcher once so the first real event doesn't
+    pay their one-time setup (lazy init, first-call code paths)."""
+    sample = json_dumps({"ctrl": "BIG", "delta": 0})
+    _match_dial_event(sample)
+    json_loads(sample)
+    json_dumps(controller_state)
 
 
 def start_app():
-    # Start background state flush thread
-    flush_thread = threading.Thread(target=state_flush_thread, daemon=True)
-    flush_thread.start()
-    
     app = web.Application()
     app.add_routes([
         web.get('/', index_handler),
         web.get('/ws', websocket_handler),
         web.get('/bridge', bridge_handler),
         web.get('/status', status_handler),
+        web.get('/position', position_handler),
         web.get('/reset', reset_position_handler),
     ])
+    app.on_startup.append(start_dial_flusher)
+    app.on_startup.append(start_relay_flusher)
+    app.on_startup.append(start_udp_bridge)
+    app.on_cleanup.append(stop_udp_bridge)
+    app.on_cleanup.append(stop_dial_flusher)
+    app.on_cleanup.append(stop_relay_flusher)
+    app.on_cleanup.append(close_open_files)
+    warm_up()
+
+    # Everything built so far (modules, HTML, handlers) lives for the whole
+    # run: move it out of the GC's reach and make gen-0 sweeps rare, so
+    # collections don't land in the middle of a relay burst
+    gc.collect()
+    gc.freeze()
+    gc.set_threshold(100_000, 50, 10)
     return app
 
 
-if __name__ == '__main__':
-    app = start_app()
-    bind_host = '10.10.101.133'
-    bind_host_local = '127.0.0.1'
-    choice = input(f"press 1 to bind to local host ({bind_host_local}), any other key to bind to {bind_host}: ")
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="MX Creative Console web receiver")
+    parser.add_argument(
+        '--host', default=os.environ.get('BIND_HOST', '127.0.0.1'),
+        help="address to bind (default: $BIND_HOST or 127.0.0.1; a LAN IP to accept remote hosts)",
+    )
+    parser.add_argument('--debug', action='store_true', help="log every event")
+    return parser.parse_args(argv)
 
-    if choice == '1':
-        bind_host = bind_host_local
 
-    print(f"[*] Starting web receiver on {bind_host}:{WEB_PORT}")
-    web.run_app(app, host=bind_host, port=WEB_PORT)
+if __name__ == '__main__':
+    args = parse_args()
+    setup_logging(args.debug)
+    app = start_app()
+    bind_host = args.host
+
+    app['bind_host'] = bind_host
+    # Hand run_app the loop directly (uvloop.install() is deprecated); without
+    # uvloop/winloop asyncio's default is used (IOCP proactor on Windows)
+    loop = uvloop.new_event_loop() if uvloop is not None else None
+    log.info("[*] Starting web receiver on %s:%s", bind_host, WEB_PORT)
+    # No access log unless --debug: /status and /position are polled, and
+    # the baseline printed nothing per request
+    web.run_app(
+        app, host=bind_host, port=WEB_PORT, loop=loop,
+        access_log=logging.getLogger('aiohttp.access') if args.debug else None,
+    )